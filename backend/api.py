@@ -4,9 +4,10 @@ Provides REST API endpoints for the React frontend
 """
 
 import asyncio
+import hmac
 import os
-from typing import Dict, Any
-from fastapi import FastAPI, HTTPException
+from typing import Dict, Any, Optional
+from fastapi import FastAPI, Header, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from dotenv import load_dotenv
@@ -16,6 +17,7 @@ import sys
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from mcp_client.client import ZomatoMCPClient
+from profiling import capture_profile
 
 load_dotenv()
 
@@ -119,6 +121,25 @@ async def reset_conversation():
     return {"status": "conversation reset"}
 
 
+@app.post("/admin/profile")
+async def profile(seconds: float = 10, x_admin_token: Optional[str] = Header(None)):
+    """
+    Capture a sampled CPU and allocation profile of the API process.
+    Requires ZOMATO_ADMIN_TOKEN to be set and sent in the X-Admin-Token header.
+    """
+    admin_token = os.getenv("ZOMATO_ADMIN_TOKEN")
+    if not admin_token or not x_admin_token or not hmac.compare_digest(admin_token, x_admin_token):
+        raise HTTPException(status_code=403, detail="Admin token required")
+    
+    if not 0 < seconds <= 300:
+        raise HTTPException(status_code=400, detail="seconds must be between 0 and 300")
+    
+    try:
+        return await capture_profile(seconds, "api")
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -0,0 +1,114 @@
+"""
+Benchmark: tool handler latency under concurrent calls on one MCP session.
+
+Runs the Zomato server in-process over memory streams, fires concurrent
+catalog searches, and probes the latency of the cheap handlers
+(``place_order`` and ``get_order_status``, alternately) alongside them.
+Each concurrency level is run with handlers inline on the event loop and
+dispatched through the executor pool.
+
+The pool keeps the cheap handlers' latency flat as searches pile up, but it
+does not make searches themselves scale: they are pure Python and share one
+interpreter lock, so search latency grows with concurrency in both modes and
+the pool's search throughput is no higher than inline. The summary line
+reports both figures.
+
+Usage:
+    python benchmarks/bench_executor.py [--restaurants 100000] [--duration 3]
+"""
+
+import argparse
+import asyncio
+import time
+
+from common import make_catalog, percentile
+
+from mcp.shared.memory import create_connected_server_and_client_session
+
+from zomato_server import server
+from zomato_server.executor import ToolExecutor
+
+
+async def _heavy_loop(session, deadline: float, latencies: list):
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        await session.call_tool("search_restaurants", {"query": "restaurant 4242"})
+        latencies.append(time.perf_counter() - start)
+
+
+async def _probe_loop(session, deadline: float, latencies: list):
+    i = 0
+    while time.perf_counter() < deadline:
+        i += 1
+        start = time.perf_counter()
+        if i % 2:
+            await session.call_tool("get_order_status", {"order_id": "ORD1001"})
+        else:
+            await session.call_tool("place_order", {
+                "restaurant_id": str(i),
+                "items": [{"item_id": f"{i}01", "quantity": 1}],
+                "delivery_address": "1 Bench Street",
+                "payment_method": "cod"
+            })
+        latencies.append(time.perf_counter() - start)
+        await asyncio.sleep(0.005)
+
+
+async def run_level(concurrency: int, duration: float):
+    heavy, probe = [], []
+    async with create_connected_server_and_client_session(server.app) as session:
+        await session.call_tool("place_order", {
+            "restaurant_id": "1",
+            "items": [{"item_id": "101", "quantity": 1}],
+            "delivery_address": "1 Bench Street",
+            "payment_method": "cod"
+        })
+        deadline = time.perf_counter() + duration
+        await asyncio.gather(
+            _probe_loop(session, deadline, probe),
+            *[_heavy_loop(session, deadline, heavy) for _ in range(concurrency)]
+        )
+    return heavy, probe
+
+
+def _ms(value: float) -> str:
+    return f"{value * 1000:8.2f}"
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--restaurants", type=int, default=100_000)
+    parser.add_argument("--duration", type=float, default=3.0)
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 4, 16])
+    args = parser.parse_args()
+
+    server.catalog.load(make_catalog(args.restaurants))
+    print(f"Catalog: {args.restaurants} restaurants, {args.duration}s per level\n")
+    print(f"{'mode':<8}{'conc':>5}{'search/s':>10}{'search p50':>12}"
+          f"{'probe p50':>12}{'probe p99':>12}{'probe max':>12}  (ms)")
+
+    results = {}
+    for mode, workers in (("inline", 0), ("pool", None)):
+        for concurrency in args.levels:
+            server.executor = ToolExecutor(workers)
+            server.orders.clear()
+            try:
+                heavy, probe = await run_level(concurrency, args.duration)
+            finally:
+                server.executor.shutdown()
+            results[mode, concurrency] = heavy
+            print(f"{mode:<8}{concurrency:>5}{len(heavy) / args.duration:>10.1f}"
+                  f"{_ms(percentile(heavy, 50)):>12}{_ms(percentile(probe, 50)):>12}"
+                  f"{_ms(percentile(probe, 99)):>12}{_ms(max(probe or [0])):>12}")
+
+    low, high = min(args.levels), max(args.levels)
+    pool_low, pool_high = results["pool", low], results["pool", high]
+    print(f"\nSearch does not scale: pool search p50 goes from "
+          f"{percentile(pool_low, 50) * 1000:.2f}ms at concurrency {low} to "
+          f"{percentile(pool_high, 50) * 1000:.2f}ms at {high}, at "
+          f"{len(pool_high) / args.duration:.1f} searches/s vs "
+          f"{len(results['inline', high]) / args.duration:.1f} inline.")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
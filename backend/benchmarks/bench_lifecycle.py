@@ -0,0 +1,97 @@
+"""
+Benchmark: order lifecycle timer wheel tick throughput.
+
+Places a large population of orders with a spread of delivery estimates over
+a short window, so nearly all of them are live at once, then drives the wheel
+until every order is delivered. Reports engine memory per live order, the
+cost of ticks that fire nothing (which should not depend on how many timers
+are pending), per-tick latency and status transitions per second.
+
+Usage:
+    python benchmarks/bench_lifecycle.py [--orders 1000000]
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+
+from common import percentile
+
+from zomato_server.lifecycle import ORDER_STAGES, OrderLifecycle
+
+DELIVERY_TIMES = ["20-30 mins", "25-35 mins", "30-40 mins", "35-45 mins", "40-50 mins", "50-60 mins"]
+
+
+def _idle_tick_cost(pending: int, ticks: int = 20_000) -> float:
+    """Mean seconds per tick for a lifecycle holding ``pending`` timers, none due."""
+    lifecycle = OrderLifecycle({})
+    for i in range(pending):
+        lifecycle.wheel.schedule(100_000 + i % 1000, str(i))
+    start = time.perf_counter()
+    for _ in range(ticks):
+        lifecycle.tick()
+    return (time.perf_counter() - start) / ticks
+
+
+def _memory_per_order(orders: dict) -> float:
+    """Bytes the engine allocates per tracked order."""
+    lifecycle = OrderLifecycle(orders)
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for order in orders.values():
+        lifecycle.track(order)
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return used / len(orders)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--orders", type=int, default=1_000_000)
+    parser.add_argument("--placement-window", type=int, default=600,
+                        help="orders are placed uniformly over this many ticks (seconds)")
+    args = parser.parse_args()
+    rng = random.Random(42)
+
+    orders = {}
+    for i in range(args.orders):
+        order_id = f"ORD{i + 1001}"
+        orders[order_id] = {"order_id": order_id, "estimated_delivery": rng.choice(DELIVERY_TIMES)}
+    placements = [[] for _ in range(args.placement_window)]
+    for order in orders.values():
+        placements[rng.randrange(args.placement_window)].append(order)
+
+    idle_empty = _idle_tick_cost(0)
+    idle_full = _idle_tick_cost(args.orders)
+    per_order = _memory_per_order(orders)
+
+    lifecycle = OrderLifecycle(orders)
+    tick_times = []
+    transitions = 0
+    peak_live = 0
+    start = time.perf_counter()
+    while lifecycle.wheel.now < args.placement_window or len(lifecycle):
+        tick_start = time.perf_counter()
+        if lifecycle.wheel.now < args.placement_window:
+            for order in placements[lifecycle.wheel.now]:
+                lifecycle.track(order)
+        transitions += lifecycle.tick()
+        tick_times.append(time.perf_counter() - tick_start)
+        peak_live = max(peak_live, len(lifecycle))
+    elapsed = time.perf_counter() - start
+
+    delivered = sum(1 for order in orders.values() if order["status"] == ORDER_STAGES[-1])
+    print(f"Orders:                 {args.orders} (peak live {peak_live})")
+    print(f"Engine memory/order:    {per_order:.1f} bytes")
+    print(f"Idle tick, 0 pending:   {idle_empty * 1e6:.2f} us")
+    print(f"Idle tick, {args.orders} pending: {idle_full * 1e6:.2f} us")
+    print(f"Ticks simulated:        {len(tick_times)} ({elapsed:.2f}s, {len(tick_times) / elapsed:.0f} ticks/s)")
+    print(f"Transitions:            {transitions} ({transitions / elapsed:.0f}/s)")
+    print(f"Tick time p50/p99/max:  {percentile(tick_times, 50) * 1e3:.3f} / "
+          f"{percentile(tick_times, 99) * 1e3:.3f} / {max(tick_times) * 1e3:.3f} ms")
+    print(f"Delivered:              {delivered}/{args.orders}")
+
+
+if __name__ == "__main__":
+    main()
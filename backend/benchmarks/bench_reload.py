@@ -0,0 +1,140 @@
+"""
+Benchmark: hot catalog reload under concurrent tool calls.
+
+Writes two large JSON Lines catalogs that differ only in their prices, then
+measures tool latency on one MCP session twice: once with a static catalog
+and once while the server keeps reloading, alternating between the two files.
+Every order placed during reloads is checked against the snapshot version it
+reports, proving it was priced from a single consistent catalog.
+
+Exits non-zero if an order was priced inconsistently, if reloads add more
+than ``--max-p99-increase`` milliseconds to p99 call latency, or if they add
+more than ``--max-worst-increase`` milliseconds to the slowest call. Reloads
+are a few seconds apart, so a stall on each one touches under 1% of calls
+and only shows up in the worst case.
+
+Usage:
+    python benchmarks/bench_reload.py [--restaurants 100000] [--items 10]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+
+from common import item_price, make_catalog, percentile
+
+from mcp.shared.memory import create_connected_server_and_client_session
+
+from zomato_server import server
+
+
+def _write_catalog(path: str, restaurants: int, items: int, price_offset: int):
+    with open(path, "w", encoding="utf-8") as f:
+        for restaurant in make_catalog(restaurants, items, price_offset):
+            f.write(json.dumps(restaurant))
+            f.write("\n")
+
+
+async def _call_loop(session, deadline: float, restaurants: int, latencies: list, orders: list):
+    i = 0
+    while time.perf_counter() < deadline:
+        i += 1
+        restaurant = 1 + (i * 7919) % restaurants
+        start = time.perf_counter()
+        if i % 2:
+            await session.call_tool("get_restaurant_menu", {"restaurant_id": str(restaurant)})
+        else:
+            result = await session.call_tool("place_order", {
+                "restaurant_id": str(restaurant),
+                "items": [{"item_id": f"{restaurant}01", "quantity": 2}],
+                "delivery_address": "1 Bench Street",
+                "payment_method": "cod"
+            })
+            orders.append((restaurant, json.loads(result.content[0].text)))
+        latencies.append(time.perf_counter() - start)
+        await asyncio.sleep(0.002)
+
+
+async def _reload_loop(deadline: float, paths: list, offsets: dict, timings: list):
+    i = 0
+    while time.perf_counter() < deadline:
+        i += 1
+        server.catalog.path = paths[i % 2]
+        start = time.perf_counter()
+        version = (await server.catalog.reload()).version
+        timings.append(time.perf_counter() - start)
+        offsets[version] = i % 2
+
+
+async def run_phase(duration: float, restaurants: int, paths: list, offsets: dict, reload: bool):
+    latencies, orders, reloads = [], [], []
+    async with create_connected_server_and_client_session(server.app) as session:
+        deadline = time.perf_counter() + duration
+        tasks = [_call_loop(session, deadline, restaurants, latencies, orders)]
+        if reload:
+            tasks.append(_reload_loop(deadline, paths, offsets, reloads))
+        await asyncio.gather(*tasks)
+    return latencies, orders, reloads
+
+
+def _report(label: str, latencies: list):
+    print(f"{label:<10}{len(latencies):>8}{percentile(latencies, 50) * 1000:>10.2f}"
+          f"{percentile(latencies, 99) * 1000:>10.2f}{max(latencies) * 1000:>10.2f}")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--restaurants", type=int, default=100_000)
+    parser.add_argument("--items", type=int, default=10)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--max-p99-increase", type=float, default=25.0,
+                        help="allowed p99 latency increase during reloads, in ms")
+    parser.add_argument("--max-worst-increase", type=float, default=50.0,
+                        help="allowed increase of the slowest call during reloads, in ms")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [os.path.join(tmp, "catalog_a.jsonl"), os.path.join(tmp, "catalog_b.jsonl")]
+        for offset, path in enumerate(paths):
+            _write_catalog(path, args.restaurants, args.items, offset)
+
+        offsets = {}
+        server.catalog.path = paths[0]
+        offsets[(await server.catalog.reload()).version] = 0
+        print(f"Catalog: {args.restaurants} restaurants x {args.items} items, "
+              f"{args.duration}s per phase\n")
+
+        base, _, _ = await run_phase(args.duration, args.restaurants, paths, offsets, False)
+        during, orders, reloads = await run_phase(args.duration, args.restaurants, paths, offsets, True)
+
+    print(f"{'phase':<10}{'calls':>8}{'p50':>10}{'p99':>10}{'max':>10}  (ms)")
+    _report("static", base)
+    _report("reloading", during)
+    print(f"\n{len(reloads)} reloads, mean {sum(reloads) / max(len(reloads), 1):.2f}s each")
+
+    inconsistent = [
+        order for restaurant, order in orders
+        if order["total"] != 2 * item_price(restaurant, 1, offsets[order["catalog_version"]])
+    ]
+    versions = {order["catalog_version"] for _, order in orders}
+    print(f"{len(orders)} orders across {len(versions)} catalog versions, "
+          f"{len(inconsistent)} inconsistent")
+
+    increase = (percentile(during, 99) - percentile(base, 99)) * 1000
+    worst_increase = (max(during) - max(base)) * 1000
+    p99_failed = increase > args.max_p99_increase
+    worst_failed = worst_increase > args.max_worst_increase
+    print(f"p99 increase during reloads: {increase:.2f}ms "
+          f"(limit {args.max_p99_increase:.2f}ms) -> {'FAIL' if p99_failed else 'OK'}")
+    print(f"worst call increase during reloads: {worst_increase:.2f}ms "
+          f"(limit {args.max_worst_increase:.2f}ms) -> {'FAIL' if worst_failed else 'OK'}")
+    failed = bool(inconsistent) or not reloads or p99_failed or worst_failed
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,42 @@
+"""
+Shared helpers for the Zomato MCP benchmarks.
+"""
+
+import os
+import sys
+from typing import Any, Dict, List
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stats import percentile  # re-exported for the benchmarks
+
+CUISINES = ["Italian", "American", "Japanese", "Indian", "Chinese", "Mexican", "Thai", "French"]
+
+
+def make_catalog(num_restaurants: int, items_per_restaurant: int = 3,
+                 price_offset: int = 0) -> List[Dict[str, Any]]:
+    """Build a synthetic catalog shaped like ``RESTAURANTS``.
+
+    ``price_offset`` is added to every item price, so catalogs built with
+    different offsets can be told apart by the totals they produce.
+    """
+    catalog = []
+    for i in range(1, num_restaurants + 1):
+        catalog.append({
+            "id": str(i),
+            "name": f"Restaurant {i}",
+            "cuisine": CUISINES[i % len(CUISINES)],
+            "rating": round(3.5 + (i % 15) / 10, 1),
+            "delivery_time": f"{20 + i % 30}-{30 + i % 30} mins",
+            "menu": [
+                {"id": f"{i}{j:02d}", "name": f"Dish {i}-{j}", "price": item_price(i, j, price_offset)}
+                for j in range(1, items_per_restaurant + 1)
+            ]
+        })
+    return catalog
+
+
+def item_price(restaurant: int, item: int, price_offset: int = 0) -> int:
+    """Price of item ``item`` at restaurant ``restaurant`` in a synthetic catalog."""
+    return 99 + (restaurant * item) % 400 + price_offset
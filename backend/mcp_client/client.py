@@ -5,12 +5,18 @@ MCP Client for Zomato with OpenAI Integration
 import asyncio
 import json
 import os
+import sys
 from typing import Optional, List, Dict, Any
 from openai import OpenAI
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 from dotenv import load_dotenv
 
+# Add backend to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mcp_client.trace import RecordingSession, TraceRecorder
+
 load_dotenv()
 
 
@@ -23,6 +29,10 @@ class ZomatoMCPClient:
         self.available_tools = []
         self.conversation_history = []
         
+        # Opt-in capture of MCP traffic for offline replay
+        trace_path = os.getenv("ZOMATO_TRACE_PATH")
+        self.recorder: Optional[TraceRecorder] = TraceRecorder(trace_path) if trace_path else None
+        
     async def connect_to_server(self):
         """Connect to the Zomato MCP server."""
         server_params = StdioServerParameters(
@@ -34,6 +44,8 @@ class ZomatoMCPClient:
         stdio_transport = await stdio_client(server_params)
         self.stdio, self.write = stdio_transport
         self.session = ClientSession(self.stdio, self.write)
+        if self.recorder:
+            self.session = RecordingSession(self.session, self.recorder)
         
         await self.session.initialize()
         
@@ -157,6 +169,8 @@ class ZomatoMCPClient:
         """Close the MCP session."""
         if self.session:
             await self.session.__aexit__(None, None, None)
+        if self.recorder:
+            self.recorder.close()
 
 
 async def main():
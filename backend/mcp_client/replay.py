@@ -0,0 +1,149 @@
+"""
+MCP Traffic Replay
+Fires a captured trace at the Zomato MCP server and reports latency and throughput.
+
+Usage (from the backend directory):
+    python mcp_client/replay.py trace.jsonl [--speed 10] [--output results.json]
+
+Requests are sent at their recorded offsets divided by ``--speed`` without
+waiting for earlier responses, so the server sees the original arrival
+pattern. ``--speed 0`` sends them back to back, one at a time. Order IDs in
+the trace match the replay as long as the server starts with no orders.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, List
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+# Add backend to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mcp_client.trace import load_trace, result_size
+from stats import percentile
+
+DEFAULT_SERVER = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "zomato_server", "server.py"
+)
+
+
+async def _send(session: ClientSession, record: Dict[str, Any], result: Dict[str, Any]):
+    started = time.perf_counter()
+    try:
+        if record["op"] == "list_tools":
+            response = await session.list_tools()
+        else:
+            response = await session.call_tool(record["tool"], record.get("args") or {})
+        result["size"] = result_size(response)
+        result["error"] = bool(getattr(response, "isError", False))
+    except Exception:
+        result["size"] = 0
+        result["error"] = True
+    result["latency"] = time.perf_counter() - started
+
+
+async def replay(session: ClientSession, records: List[Dict[str, Any]], speed: float) -> Dict[str, Any]:
+    """Send ``records`` over ``session`` and return per-request measurements."""
+    results = [
+        {"op": r["op"], "tool": r.get("tool"), "recorded_size": r.get("size")} for r in records
+    ]
+    origin = records[0]["t"] if records else 0.0
+    started = time.perf_counter()
+
+    if speed > 0:
+        tasks = []
+        for record, result in zip(records, results):
+            delay = (record["t"] - origin) / speed - (time.perf_counter() - started)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            result["lag"] = max(0.0, -delay)
+            tasks.append(asyncio.create_task(_send(session, record, result)))
+        await asyncio.gather(*tasks)
+    else:
+        for record, result in zip(records, results):
+            await _send(session, record, result)
+
+    return {"elapsed": time.perf_counter() - started, "requests": results}
+
+
+def summarize(run: Dict[str, Any]) -> Dict[str, Any]:
+    """Group latencies by tool and compute distribution and throughput figures."""
+    groups: Dict[str, List[Dict[str, Any]]] = {}
+    for result in run["requests"]:
+        groups.setdefault(result["tool"] or result["op"], []).append(result)
+    groups["all"] = run["requests"]
+
+    summary = {
+        "elapsed": run["elapsed"],
+        "throughput": len(run["requests"]) / run["elapsed"] if run["elapsed"] else 0.0,
+        "max_lag": max((r.get("lag", 0.0) for r in run["requests"]), default=0.0),
+        "tools": {}
+    }
+    for name, results in groups.items():
+        latencies = [r["latency"] for r in results]
+        if not latencies:
+            continue
+        summary["tools"][name] = {
+            "count": len(results),
+            "errors": sum(1 for r in results if r["error"]),
+            "size_mismatches": sum(
+                1 for r in results
+                if r["recorded_size"] is not None and r["size"] != r["recorded_size"]
+            ),
+            "mean": sum(latencies) / len(latencies),
+            "p50": percentile(latencies, 50),
+            "p90": percentile(latencies, 90),
+            "p99": percentile(latencies, 99),
+            "max": max(latencies),
+        }
+    return summary
+
+
+def print_summary(summary: Dict[str, Any]):
+    print(f"{'tool':<22}{'count':>7}{'errors':>8}{'p50':>9}{'p90':>9}{'p99':>9}{'max':>9}  (ms)")
+    for name, stats in summary["tools"].items():
+        print(f"{name:<22}{stats['count']:>7}{stats['errors']:>8}"
+              f"{stats['p50'] * 1000:>9.2f}{stats['p90'] * 1000:>9.2f}"
+              f"{stats['p99'] * 1000:>9.2f}{stats['max'] * 1000:>9.2f}")
+    mismatches = summary["tools"].get("all", {}).get("size_mismatches", 0)
+    print(f"\nElapsed {summary['elapsed']:.2f}s, {summary['throughput']:.1f} requests/s, "
+          f"max send lag {summary['max_lag'] * 1000:.2f}ms, {mismatches} result size mismatches")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Replay a captured MCP trace against the Zomato server.")
+    parser.add_argument("trace", help="trace file written with ZOMATO_TRACE_PATH")
+    parser.add_argument("--speed", type=float, default=1.0,
+                        help="timing acceleration factor; 0 sends requests back to back")
+    parser.add_argument("--server", default=DEFAULT_SERVER, help="path to the MCP server script")
+    parser.add_argument("--output", help="write the summary as JSON to this file")
+    args = parser.parse_args()
+
+    _, records = load_trace(args.trace)
+    server_params = StdioServerParameters(
+        command=sys.executable,
+        args=["-u", args.server],
+        env=dict(os.environ)
+    )
+
+    async with stdio_client(server_params) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            run = await replay(session, records, args.speed)
+
+    summary = summarize(run)
+    print(f"Replayed {len(records)} requests from {args.trace} at speed {args.speed:g}\n")
+    print_summary(summary)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,114 @@
+"""
+MCP Traffic Capture
+Records the list_tools/call_tool requests a client sends to an MCP server.
+"""
+
+import json
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+TRACE_FORMAT = "zomato-mcp-trace"
+TRACE_VERSION = 1
+
+
+class TraceRecorder:
+    """Writes one compact JSON line per MCP request.
+
+    The first line is a header; each following line holds the request's
+    offset from the start of the trace (``t``), its duration (``dur``), the
+    operation, tool name and arguments, the result size in bytes and whether
+    it failed. Times are in seconds, rounded to microseconds.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        # Line buffered, so every request reaches the file as soon as it is
+        # recorded and a crashed client still leaves a usable trace.
+        self._file = open(path, "w", encoding="utf-8", buffering=1)
+        self._started = time.perf_counter()
+        self._write({"format": TRACE_FORMAT, "version": TRACE_VERSION, "started": time.time()})
+
+    def _write(self, record: Dict[str, Any]):
+        self._file.write(json.dumps(record, separators=(",", ":")))
+        self._file.write("\n")
+
+    def now(self) -> float:
+        """Seconds since the trace started."""
+        return time.perf_counter() - self._started
+
+    def record(self, op: str, started: float, duration: float, size: int,
+               tool: Optional[str] = None, args: Optional[Dict[str, Any]] = None,
+               error: bool = False):
+        """Append one request to the trace."""
+        record = {"t": round(started, 6), "dur": round(duration, 6), "op": op}
+        if tool is not None:
+            record["tool"] = tool
+            record["args"] = args or {}
+        record["size"] = size
+        if error:
+            record["error"] = True
+        self._write(record)
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+
+def result_size(result: Any) -> int:
+    """Size in bytes of an MCP result's text content, or of its JSON form."""
+    content = getattr(result, "content", None)
+    if content is not None:
+        return sum(len(getattr(c, "text", "").encode("utf-8")) for c in content)
+    return len(result.model_dump_json().encode("utf-8"))
+
+
+class RecordingSession:
+    """Wraps a ``ClientSession`` and records its list_tools/call_tool traffic.
+
+    Every other attribute is delegated to the wrapped session.
+    """
+
+    def __init__(self, session: Any, recorder: TraceRecorder):
+        self._session = session
+        self.recorder = recorder
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._session, name)
+
+    async def list_tools(self, *args: Any, **kwargs: Any) -> Any:
+        started = self.recorder.now()
+        try:
+            result = await self._session.list_tools(*args, **kwargs)
+        except Exception:
+            self.recorder.record("list_tools", started, self.recorder.now() - started, 0, error=True)
+            raise
+        self.recorder.record("list_tools", started, self.recorder.now() - started, result_size(result))
+        return result
+
+    async def call_tool(self, name: str, arguments: Optional[Dict[str, Any]] = None,
+                        *args: Any, **kwargs: Any) -> Any:
+        started = self.recorder.now()
+        try:
+            result = await self._session.call_tool(name, arguments, *args, **kwargs)
+        except Exception:
+            self.recorder.record(
+                "call_tool", started, self.recorder.now() - started, 0,
+                tool=name, args=arguments, error=True
+            )
+            raise
+        self.recorder.record(
+            "call_tool", started, self.recorder.now() - started, result_size(result),
+            tool=name, args=arguments, error=bool(getattr(result, "isError", False))
+        )
+        return result
+
+
+def load_trace(path: str) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """Read a trace file, returning its header and its records in time order."""
+    with open(path, encoding="utf-8") as f:
+        lines = [json.loads(line) for line in f if line.strip()]
+    if not lines or lines[0].get("format") != TRACE_FORMAT:
+        raise ValueError(f"{path} is not a {TRACE_FORMAT} file")
+    if lines[0].get("version") != TRACE_VERSION:
+        raise ValueError(f"Unsupported trace version: {lines[0].get('version')}")
+    return lines[0], sorted(lines[1:], key=lambda r: r["t"])
@@ -0,0 +1,321 @@
+"""
+On-demand Profiling
+Sampled CPU stacks and tracemalloc allocation profiles for the API and MCP server.
+
+Nothing here runs until a capture is requested: no sampler thread exists and
+tracemalloc stays off, so there is no overhead while profiling is idle.
+"""
+
+import asyncio
+import fnmatch
+import os
+import signal
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+# Allocation groups reported in the tracemalloc summary, as filename patterns
+# matched against any frame of an allocation's traceback.
+ALLOCATION_GROUPS = {
+    "history": ["*/mcp_client/client.py"],
+    "serialization": ["*/json/*", "*/pydantic/*", "*/pydantic_core/*"],
+}
+
+# Leaf frames of threads that are blocked rather than running
+_IDLE_FRAMES = {
+    ("selectors.py", "select"),
+    ("threading.py", "wait"),
+    ("queue.py", "get"),
+    ("thread.py", "_worker"),
+    ("_asyncio.py", "run"),
+}
+
+_capture_lock = threading.Lock()
+
+
+class SamplingProfiler:
+    """Samples the Python stack of every thread at a fixed interval.
+
+    Stacks are aggregated in folded format (``root;...;leaf``), rooted at the
+    thread name. Threads blocked in a selector, lock or queue wait are counted
+    as idle and left out of the stacks, so the result approximates CPU time.
+    The profiler's own threads are not sampled.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self.idle = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        thread = threading.Thread(target=self._run, name="profiler", daemon=True)
+        thread.start()
+        self._thread = thread
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if names.get(thread_id, "").startswith("profiler"):
+                    continue
+                self.samples += 1
+                code = frame.f_code
+                if (os.path.basename(code.co_filename), code.co_name) in _IDLE_FRAMES:
+                    self.idle += 1
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                stack.append(names.get(thread_id, str(thread_id)))
+                self.stacks[";".join(reversed(stack))] += 1
+
+
+class SnapshotTaker:
+    """Takes tracemalloc snapshots on its own thread during a capture.
+
+    Snapshots are taken every ``interval`` seconds, at most ``limit`` times,
+    and kept raw: ``take_snapshot`` is a single C call, while grouping the
+    traces is slow Python that is left until the capture has ended. Summed
+    over all snapshots, the live bytes per traceback rank allocators by the
+    memory they held across the window, so short-lived allocations made
+    while serving requests show up next to memory still held at the end.
+    """
+
+    def __init__(self, interval: float = 1.0, limit: int = 10):
+        self.interval = interval
+        self.limit = limit
+        self.snapshots: List[tracemalloc.Snapshot] = []
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        thread = threading.Thread(target=self._run, name="profiler-snapshots", daemon=True)
+        thread.start()
+        self._thread = thread
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+
+    def take(self):
+        if tracemalloc.is_tracing():
+            self.snapshots.append(tracemalloc.take_snapshot())
+
+    def _run(self):
+        while len(self.snapshots) < self.limit - 1 and not self._stop.wait(self.interval):
+            self.take()
+
+    def allocations(self) -> Counter:
+        """Live bytes per allocation traceback, summed over all snapshots."""
+        allocations: Counter = Counter()
+        for snapshot in self.snapshots:
+            snapshot = snapshot.filter_traces([
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),
+            ])
+            for stat in snapshot.statistics("traceback"):
+                allocations[stat.traceback] += stat.size
+        return allocations
+
+
+def _write_folded(path: str, stacks: Counter):
+    with open(path, "w", encoding="utf-8") as f:
+        for stack, count in stacks.most_common():
+            f.write(f"{stack} {count}\n")
+
+
+def _allocation_stacks(allocations: Counter, snapshots: int) -> Counter:
+    """Fold allocation tracebacks into stacks weighted by mean live bytes."""
+    stacks: Counter = Counter()
+    for traceback, size in allocations.items():
+        frames = [f"{os.path.basename(frame.filename)}:{frame.lineno}" for frame in traceback]
+        stacks[";".join(frames)] += size // max(snapshots, 1)
+    return stacks
+
+
+def _top_lines(allocations: Counter, snapshots: int, top: int) -> List[str]:
+    lines: Counter = Counter()
+    for traceback, size in allocations.items():
+        frame = traceback[-1]
+        lines[f"{frame.filename}:{frame.lineno}"] += size
+    total = sum(lines.values()) / max(snapshots, 1)
+    return [f"({total / 1024:.1f} KiB)"] + [
+        f"  {line}: {size / max(snapshots, 1) / 1024:.1f} KiB"
+        for line, size in lines.most_common(top)
+    ]
+
+
+def _allocation_summary(allocations: Counter, snapshots: int, interval: float,
+                        top: int, peak: int) -> str:
+    lines = [
+        f"Traced memory peak during the window: {peak / 1024:.1f} KiB",
+        f"Allocators below are ranked by mean live memory over {snapshots} snapshots "
+        f"taken every {interval:g}s.",
+        "",
+    ]
+    header, *ranked = _top_lines(allocations, snapshots, top)
+    lines.append(f"Top {top} allocators {header}")
+    lines.extend(ranked)
+
+    for group, patterns in ALLOCATION_GROUPS.items():
+        matching = Counter({
+            traceback: size for traceback, size in allocations.items()
+            if any(fnmatch.fnmatch(frame.filename, pattern)
+                   for frame in traceback for pattern in patterns)
+        })
+        header, *ranked = _top_lines(matching, snapshots, top)
+        lines.append("")
+        lines.append(f"Top {top} allocators in {group} paths {header}")
+        lines.extend(ranked or ["  (none)"])
+    return "\n".join(lines) + "\n"
+
+
+class ProfileCapture:
+    """One profiling window: a stack sampler plus tracemalloc.
+
+    ``stop`` writes three files to ``output_dir``: ``*-cpu.folded`` and
+    ``*-alloc.folded`` in the folded-stack format read by flamegraph.pl and
+    speedscope, and ``*-tracemalloc.txt`` with the top allocators overall and
+    in the history and serialization paths. Both allocation reports come from
+    the periodic tracemalloc snapshots plus one taken at the end.
+
+    ``seconds`` is the window length the caller asked for. The result reports
+    it next to the measured ``duration`` and sets ``overran`` when the window
+    ran more than 10% long, e.g. because the event loop was too busy to end it
+    on time.
+    """
+
+    def __init__(self, prefix: str, output_dir: Optional[str] = None,
+                 interval: float = 0.005, snapshot_interval: float = 1.0,
+                 max_snapshots: int = 10, nframes: int = 10, top: int = 15,
+                 seconds: Optional[float] = None):
+        self.prefix = prefix
+        self.seconds = seconds
+        self.output_dir = output_dir or os.getenv("ZOMATO_PROFILE_DIR", "profiles")
+        self.nframes = nframes
+        self.top = top
+        self.sampler = SamplingProfiler(interval)
+        self.memory = SnapshotTaker(snapshot_interval, max_snapshots)
+        self._started_tracemalloc = False
+        self._started = 0.0
+
+    def start(self):
+        if not _capture_lock.acquire(blocking=False):
+            raise RuntimeError("A profile capture is already running")
+        try:
+            self._started = time.perf_counter()
+            if tracemalloc.is_tracing():
+                tracemalloc.reset_peak()
+            else:
+                tracemalloc.start(self.nframes)
+                self._started_tracemalloc = True
+            self.sampler.start()
+            self.memory.start()
+        except BaseException:
+            self.sampler.stop()
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+                self._started_tracemalloc = False
+            _capture_lock.release()
+            raise
+
+    def stop(self) -> Dict[str, Any]:
+        try:
+            try:
+                self.sampler.stop()
+                self.memory.stop()
+                duration = time.perf_counter() - self._started
+                self.memory.take()
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                if self._started_tracemalloc:
+                    tracemalloc.stop()
+
+            os.makedirs(self.output_dir, exist_ok=True)
+            base = os.path.join(self.output_dir, f"{self.prefix}-{time.strftime('%Y%m%d-%H%M%S')}")
+            paths = {
+                "cpu_profile": f"{base}-cpu.folded",
+                "alloc_profile": f"{base}-alloc.folded",
+                "tracemalloc_summary": f"{base}-tracemalloc.txt",
+            }
+            allocations, snapshots = self.memory.allocations(), len(self.memory.snapshots)
+            _write_folded(paths["cpu_profile"], self.sampler.stacks)
+            _write_folded(paths["alloc_profile"], _allocation_stacks(allocations, snapshots))
+            with open(paths["tracemalloc_summary"], "w", encoding="utf-8") as f:
+                f.write(_allocation_summary(
+                    allocations, snapshots, self.memory.interval, self.top, peak
+                ))
+        finally:
+            _capture_lock.release()
+
+        return {
+            **paths,
+            "requested_duration": self.seconds,
+            "duration": round(duration, 3),
+            "overran": self.seconds is not None and duration > self.seconds * 1.1,
+            "samples": self.sampler.samples,
+            "idle_samples": self.sampler.idle,
+            "allocation_snapshots": snapshots,
+            "traced_peak_bytes": peak,
+        }
+
+
+async def capture_profile(seconds: float, prefix: str, **kwargs: Any) -> Dict[str, Any]:
+    """Profile this process for ``seconds`` and return the written file paths.
+
+    Raises RuntimeError if another capture is already running.
+    """
+    capture = ProfileCapture(prefix, seconds=seconds, **kwargs)
+    capture.start()
+    try:
+        await asyncio.sleep(seconds)
+    finally:
+        result = await asyncio.to_thread(capture.stop)
+    return result
+
+
+def install_profile_signal(prefix: str, sig: int = getattr(signal, "SIGUSR1", 0)):
+    """Capture a profile whenever the process receives ``sig`` (SIGUSR1).
+
+    The window length comes from ``ZOMATO_PROFILE_SECONDS`` (default 30).
+    Progress is logged to stderr, which keeps stdio transports clean.
+    """
+    if not sig:
+        return
+    loop = asyncio.get_running_loop()
+    tasks = set()
+
+    async def _capture():
+        seconds = float(os.getenv("ZOMATO_PROFILE_SECONDS", "30"))
+        print(f"Profiling for {seconds:g}s...", file=sys.stderr)
+        try:
+            result = await capture_profile(seconds, prefix)
+        except RuntimeError as e:
+            print(f"Profiling skipped: {e}", file=sys.stderr)
+            return
+        print(f"Profile written: {result['cpu_profile']}, {result['alloc_profile']}, "
+              f"{result['tracemalloc_summary']}", file=sys.stderr)
+        if result["overran"]:
+            print(f"Profile window ran {result['duration']:g}s, "
+                  f"longer than the requested {seconds:g}s", file=sys.stderr)
+
+    def _on_signal():
+        task = loop.create_task(_capture())
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+    loop.add_signal_handler(sig, _on_signal)
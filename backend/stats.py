@@ -0,0 +1,15 @@
+"""
+Latency Statistics
+Summary helpers shared by the benchmarks and the trace replay tool.
+"""
+
+from typing import List
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Return the ``pct`` percentile of ``samples`` (nearest-rank)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
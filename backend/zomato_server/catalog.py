@@ -0,0 +1,264 @@
+"""
+Restaurant Catalog
+Indexed, copy-on-write catalog snapshots with hot reload.
+"""
+
+import asyncio
+import gc
+import json
+import os
+import signal
+import sys
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Fields of a menu item, in the order a snapshot stores them
+MENU_ITEM_FIELDS = ("id", "name", "price")
+
+
+class CatalogSnapshot:
+    """An immutable, indexed view of the restaurant catalog.
+
+    Snapshots are not modified while anyone can read them. Readers grab the
+    current snapshot once per call and use it throughout, so a call always
+    sees one consistent catalog version even if a reload swaps in a newer one
+    midway. Once replaced and no longer read, a snapshot is emptied by
+    ``Catalog`` a chunk at a time (see ``Catalog.reload``).
+
+    The data is kept in shapes the cyclic garbage collector does not track:
+    restaurant details as dicts of plain values, menus and search keys as
+    tuples of plain values. Only the few top-level indexes are tracked, so
+    full collections do not rescan a million-item catalog. Menus are turned
+    back into dicts when read.
+    """
+
+    __slots__ = ("version", "by_id", "menus", "_search_keys", "readers")
+
+    def __init__(self, version: int, restaurants: Iterable[Dict[str, Any]]):
+        self.version = version
+        # Leases held through Catalog.read()
+        self.readers = 0
+        self.by_id: Dict[str, Dict[str, Any]] = {}
+        self.menus: Dict[str, Tuple[Tuple[Any, ...], ...]] = {}
+        self._search_keys: List[Tuple[str, str, str]] = []
+        for restaurant in restaurants:
+            restaurant_id = restaurant["id"]
+            self.by_id[restaurant_id] = {k: v for k, v in restaurant.items() if k != "menu"}
+            self.menus[restaurant_id] = tuple(
+                tuple(m[field] for field in MENU_ITEM_FIELDS) for m in restaurant["menu"]
+            )
+            self._search_keys.append(
+                (restaurant["name"].lower(), restaurant["cuisine"].lower(), restaurant_id)
+            )
+
+    def __len__(self) -> int:
+        return len(self.by_id)
+
+    def get_restaurant(self, restaurant_id: str) -> Optional[Dict[str, Any]]:
+        """Return a restaurant's details (without its menu) by ID, or None."""
+        return self.by_id.get(restaurant_id)
+
+    def get_menu(self, restaurant_id: str) -> Optional[List[Dict[str, Any]]]:
+        """Return a restaurant's menu items by restaurant ID, or None."""
+        menu = self.menus.get(restaurant_id)
+        if menu is None:
+            return None
+        return [dict(zip(MENU_ITEM_FIELDS, item)) for item in menu]
+
+    def get_menu_item(self, restaurant_id: str, item_id: str) -> Optional[Dict[str, Any]]:
+        """Return a menu item of a restaurant by ID, or None."""
+        for item in self.menus.get(restaurant_id, ()):
+            if item[0] == item_id:
+                return dict(zip(MENU_ITEM_FIELDS, item))
+        return None
+
+    def search(self, query: str) -> List[Dict[str, Any]]:
+        """Return restaurants, with their menus, whose name or cuisine contains ``query``."""
+        query = query.lower()
+        return [
+            {**self.by_id[restaurant_id], "menu": self.get_menu(restaurant_id)}
+            for name, cuisine, restaurant_id in self._search_keys
+            if query in name or query in cuisine
+        ]
+
+
+def iter_catalog_file(path: str) -> Iterator[Dict[str, Any]]:
+    """Yield restaurants from a JSON array file or a JSON Lines file (``.jsonl``).
+
+    JSON Lines is preferred for large catalogs: each line is parsed as it is
+    indexed, so a reload never holds the whole parsed file in memory and the
+    garbage collector never has a large batch of fresh containers to scan.
+    """
+    with open(path, encoding="utf-8") as f:
+        if path.endswith(".jsonl"):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from json.load(f)
+
+
+@contextmanager
+def _deferred_full_collections(threshold: int = 1_000_000):
+    """Postpone full garbage collections while a snapshot is being built.
+
+    Building churns through millions of short-lived objects, which keeps
+    triggering full collections of the whole process heap on the thread
+    doing the build, and those hold the GIL for tens of milliseconds each.
+    Young generations are still collected, and the usual thresholds are
+    restored afterwards, so nothing is kept alive for longer than the build.
+    """
+    gen0, gen1, gen2 = gc.get_threshold()
+    gc.set_threshold(gen0, gen1, max(gen2, threshold))
+    try:
+        yield
+    finally:
+        gc.set_threshold(gen0, gen1, gen2)
+
+
+class Catalog:
+    """Holds the current catalog snapshot and swaps in new ones atomically.
+
+    Handlers on the event loop call ``current()``, a single attribute load,
+    and may use the snapshot until they next await. Code that reads a snapshot
+    on another thread, or across an await, must hold it through ``read()``.
+    Reloads build the new snapshot on a background thread and replace the
+    reference in one step. The old snapshot is then freed on the loop a chunk
+    at a time once its last ``read()`` lease is released: freeing a million
+    items runs in C and holds the GIL, so doing it in one go (on any thread)
+    would stall the loop for over 100ms.
+
+    Catalog files are read whole on every reload, so they must be replaced
+    atomically: write the new catalog to a temporary file in the same
+    directory and rename it over the old one. Writing in place can expose a
+    half-written file, and a JSON Lines file cut at a line boundary still
+    parses as a smaller catalog.
+    """
+
+    def __init__(self, restaurants: List[Dict[str, Any]], path: Optional[str] = None):
+        self.path = path
+        self._snapshot = CatalogSnapshot(1, restaurants)
+        self._reload_lock = asyncio.Lock()
+        self._readers_lock = threading.Lock()
+        self._mtime_ns: Optional[int] = None
+        self._signal_tasks = set()
+        if path:
+            self._mtime_ns = os.stat(path).st_mtime_ns
+            self.load(iter_catalog_file(path))
+
+    def current(self) -> CatalogSnapshot:
+        """Return the current snapshot."""
+        return self._snapshot
+
+    @contextmanager
+    def read(self) -> Iterator[CatalogSnapshot]:
+        """Lease the current snapshot so it is not freed while in use.
+
+        Safe to call from any thread.
+        """
+        with self._readers_lock:
+            snapshot = self._snapshot
+            snapshot.readers += 1
+        try:
+            yield snapshot
+        finally:
+            with self._readers_lock:
+                snapshot.readers -= 1
+
+    @property
+    def version(self) -> int:
+        return self._snapshot.version
+
+    def load(self, restaurants: Iterable[Dict[str, Any]]) -> CatalogSnapshot:
+        """Build a snapshot from ``restaurants`` and swap it in synchronously.
+
+        The old snapshot is freed in one go, so this is meant for startup.
+        """
+        snapshot = CatalogSnapshot(self._snapshot.version + 1, restaurants)
+        with self._readers_lock:
+            self._snapshot = snapshot
+        return snapshot
+
+    async def reload(self, restaurants: Optional[List[Dict[str, Any]]] = None) -> CatalogSnapshot:
+        """Rebuild the catalog off the event loop and swap it in.
+
+        With no ``restaurants`` the catalog file is re-read. Concurrent reloads
+        are serialised so versions increase monotonically. Returns once the
+        old snapshot has been freed, so at most two are held at a time.
+        """
+        async with self._reload_lock:
+            version = self._snapshot.version + 1
+            if restaurants is None and not self.path:
+                raise ValueError("No catalog file configured")
+            if restaurants is None:
+                restaurants = iter_catalog_file(self.path)
+            with _deferred_full_collections():
+                snapshot = await asyncio.to_thread(CatalogSnapshot, version, restaurants)
+
+            with self._readers_lock:
+                previous, self._snapshot = self._snapshot, snapshot
+            await self._release(previous)
+            return snapshot
+
+    async def _release(self, snapshot: CatalogSnapshot, chunk: int = 2000,
+                       poll: float = 0.01):
+        """Empty a replaced snapshot a chunk at a time, yielding in between.
+
+        No new leases can be taken on it, so once the existing ones are
+        released nobody else is reading it.
+        """
+        while snapshot.readers:
+            await asyncio.sleep(poll)
+        for index in (snapshot.menus, snapshot.by_id):
+            while index:
+                for _ in range(min(chunk, len(index))):
+                    index.popitem()
+                await asyncio.sleep(0)
+        keys = snapshot._search_keys
+        while keys:
+            del keys[-chunk:]
+            await asyncio.sleep(0)
+
+    async def _reload_logged(self, reason: str) -> bool:
+        try:
+            snapshot = await self.reload()
+        except Exception as e:
+            print(f"Catalog reload ({reason}) failed: {e}", file=sys.stderr)
+            return False
+        print(
+            f"Catalog reloaded ({reason}): version {snapshot.version}, "
+            f"{len(snapshot)} restaurants",
+            file=sys.stderr
+        )
+        return True
+
+    async def watch(self, interval: float = 2.0):
+        """Poll the catalog file and reload whenever it changes.
+
+        The file's mtime is only recorded after a successful reload, so a
+        failed reload is retried on the next poll.
+        """
+        if not self.path:
+            return
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                mtime_ns = os.stat(self.path).st_mtime_ns
+            except OSError:
+                continue
+            if mtime_ns != self._mtime_ns and await self._reload_logged("file changed"):
+                self._mtime_ns = mtime_ns
+
+    def install_signal_handler(self, sig: int = getattr(signal, "SIGHUP", 0)):
+        """Reload the catalog file when the process receives ``sig`` (SIGHUP)."""
+        if not self.path or not sig:
+            return
+        loop = asyncio.get_running_loop()
+
+        def _on_signal():
+            task = loop.create_task(self._reload_logged("signal"))
+            self._signal_tasks.add(task)
+            task.add_done_callback(self._signal_tasks.discard)
+
+        loop.add_signal_handler(sig, _on_signal)
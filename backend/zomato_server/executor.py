@@ -0,0 +1,63 @@
+"""
+Tool Executor
+Dispatches CPU-bound MCP tool handlers off the server event loop.
+"""
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Optional
+
+
+class ToolExecutor:
+    """Runs synchronous tool handlers on a worker thread pool.
+
+    The MCP server multiplexes every request of a session over one event loop,
+    so a handler that scans a large catalog inline stalls all other calls.
+    Handlers dispatched through ``run`` execute on the pool instead, leaving
+    the loop free to serve cheap calls while heavy ones are in flight.
+
+    This only protects the other calls. Handlers are pure Python and hold the
+    GIL, so the dispatched handlers themselves do not scale: concurrent calls
+    queue for the one interpreter, their latency grows roughly linearly with
+    concurrency, and throughput is slightly below running them inline because
+    of the thread hand-offs. Extra workers do not help and compete with the
+    event loop thread, so a single worker is the default; raise
+    ``ZOMATO_EXECUTOR_WORKERS`` only if handlers start releasing the GIL.
+    ``max_workers=0`` disables the pool and runs handlers inline, which is
+    useful for comparing both modes.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        if max_workers is None:
+            max_workers = int(os.getenv("ZOMATO_EXECUTOR_WORKERS", "1"))
+        self.max_workers = max_workers
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def inline(self) -> bool:
+        """Whether handlers run directly on the calling event loop."""
+        return self.max_workers <= 0
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="zomato-tool"
+            )
+        return self._pool
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run ``func(*args)`` on the worker pool and await its result."""
+        if self.inline:
+            return func(*args)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_pool(), partial(func, *args))
+
+    def shutdown(self):
+        """Stop the worker pool, waiting for running handlers to finish."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
@@ -5,12 +5,21 @@ A simulated MCP server that provides Zomato restaurant data and order placement
 
 import asyncio
 import json
-from typing import Any, Sequence
-from threading import Lock
+import os
+import sys
+from typing import Any, Dict, Sequence
 from mcp.server import Server
 from mcp.types import Tool, TextContent, Resource, EmbeddedResource
 from mcp.server.stdio import stdio_server
 
+# Add backend to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from profiling import install_profile_signal
+from zomato_server.catalog import Catalog
+from zomato_server.executor import ToolExecutor
+from zomato_server.lifecycle import OrderLifecycle
+
 
 # Simulated restaurant database
 RESTAURANTS = [
@@ -64,9 +73,19 @@ RESTAURANTS = [
     }
 ]
 
-# Order storage with thread-safety
-orders = []
-orders_lock = Lock()
+# Live catalog: indexed snapshots of RESTAURANTS, or of the file named by
+# ZOMATO_CATALOG_PATH, which is hot-reloaded on change or SIGHUP.
+catalog = Catalog(RESTAURANTS, path=os.getenv("ZOMATO_CATALOG_PATH"))
+
+# Order storage keyed by order ID. Orders are only mutated on the event loop.
+orders: Dict[str, Dict[str, Any]] = {}
+
+# Advances order statuses; ZOMATO_ORDER_TIME_SCALE speeds up the clock for demos
+lifecycle = OrderLifecycle(orders, time_scale=float(os.getenv("ZOMATO_ORDER_TIME_SCALE", "1")))
+
+
+# Worker pool for CPU-bound tool handlers
+executor = ToolExecutor()
 
 
 app = Server("zomato-mcp-server")
@@ -154,116 +173,139 @@ async def list_tools() -> list[Tool]:
     ]
 
 
+def _search_restaurants(arguments: Any) -> str:
+    """Scan the catalog for restaurants matching the query. Runs on the executor."""
+    with catalog.read() as snapshot:
+        results = snapshot.search(arguments.get("query", ""))
+    return json.dumps(results, indent=2)
+
+
+def _get_restaurant_menu(arguments: Any) -> str:
+    """Look up a restaurant menu. Cheap enough to run on the event loop."""
+    snapshot = catalog.current()
+    restaurant_id = arguments.get("restaurant_id")
+    restaurant = snapshot.get_restaurant(restaurant_id)
+    if restaurant:
+        return json.dumps({
+            "restaurant": restaurant["name"],
+            "menu": snapshot.get_menu(restaurant_id)
+        }, indent=2)
+    return json.dumps({"error": "Restaurant not found"})
+
+
+def _price_order(arguments: Any) -> Dict[str, Any]:
+    """Validate an order and calculate its total.
+
+    Returns either ``{"error": ...}`` or the order fields that do not depend
+    on shared order state. All prices come from a single catalog snapshot, even
+    if a reload lands while the order is being priced.
+    """
+    snapshot = catalog.current()
+    restaurant_id = arguments.get("restaurant_id")
+    items = arguments.get("items", [])
+    payment_method = arguments.get("payment_method")
+
+    if payment_method.lower() != "cod":
+        return {"error": "Only Cash on Delivery (COD) is supported"}
+
+    restaurant = snapshot.get_restaurant(restaurant_id)
+    if not restaurant:
+        return {"error": "Restaurant not found"}
+
+    # Calculate total
+    total = 0
+    order_items = []
+    for item in items:
+        menu_item = snapshot.get_menu_item(restaurant_id, item["item_id"])
+        if menu_item:
+            quantity = item.get("quantity", 1)
+            total += menu_item["price"] * quantity
+            order_items.append({
+                "name": menu_item["name"],
+                "quantity": quantity,
+                "price": menu_item["price"]
+            })
+
+    return {
+        "restaurant": restaurant["name"],
+        "items": order_items,
+        "total": total,
+        "estimated_delivery": restaurant["delivery_time"],
+        "catalog_version": snapshot.version
+    }
+
+
+def _place_order(arguments: Any) -> str:
+    """Price and record an order. Cheap enough to run on the event loop.
+
+    Pricing is a few indexed lookups, so it is not sent to the executor,
+    where it would queue behind pending catalog scans.
+    """
+    priced = _price_order(arguments)
+    if "error" in priced:
+        return json.dumps(priced)
+
+    # Runs on the event loop without awaiting, so ID allocation is atomic
+    # without a lock.
+    order_id = f"ORD{len(orders) + 1001}"
+    order = {
+        "order_id": order_id,
+        "restaurant": priced["restaurant"],
+        "items": priced["items"],
+        "total": priced["total"],
+        "delivery_address": arguments.get("delivery_address"),
+        "payment_method": "Cash on Delivery",
+        "status": "Order Placed",
+        "estimated_delivery": priced["estimated_delivery"],
+        "catalog_version": priced["catalog_version"]
+    }
+    orders[order_id] = order
+    lifecycle.track(order)
+
+    return json.dumps(order, indent=2)
+
+
+def _get_order_status(arguments: Any) -> str:
+    """Look up an order by ID. Cheap enough to run on the event loop."""
+    order = orders.get(arguments.get("order_id"))
+    if order:
+        return json.dumps(order, indent=2)
+    return json.dumps({"error": "Order not found"})
+
+
 @app.call_tool()
 async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
     """Handle tool calls for the Zomato MCP server."""
     
     if name == "search_restaurants":
-        query = arguments.get("query", "").lower()
-        results = [
-            r for r in RESTAURANTS
-            if query in r["name"].lower() or query in r["cuisine"].lower()
-        ]
-        return [TextContent(
-            type="text",
-            text=json.dumps(results, indent=2)
-        )]
-    
+        text = await executor.run(_search_restaurants, arguments)
     elif name == "get_restaurant_menu":
-        restaurant_id = arguments.get("restaurant_id")
-        restaurant = next((r for r in RESTAURANTS if r["id"] == restaurant_id), None)
-        if restaurant:
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "restaurant": restaurant["name"],
-                    "menu": restaurant["menu"]
-                }, indent=2)
-            )]
-        else:
-            return [TextContent(
-                type="text",
-                text=json.dumps({"error": "Restaurant not found"})
-            )]
-    
+        text = _get_restaurant_menu(arguments)
     elif name == "place_order":
-        restaurant_id = arguments.get("restaurant_id")
-        items = arguments.get("items", [])
-        delivery_address = arguments.get("delivery_address")
-        payment_method = arguments.get("payment_method")
-        
-        if payment_method.lower() != "cod":
-            return [TextContent(
-                type="text",
-                text=json.dumps({"error": "Only Cash on Delivery (COD) is supported"})
-            )]
-        
-        restaurant = next((r for r in RESTAURANTS if r["id"] == restaurant_id), None)
-        if not restaurant:
-            return [TextContent(
-                type="text",
-                text=json.dumps({"error": "Restaurant not found"})
-            )]
-        
-        # Calculate total
-        total = 0
-        order_items = []
-        for item in items:
-            menu_item = next((m for m in restaurant["menu"] if m["id"] == item["item_id"]), None)
-            if menu_item:
-                quantity = item.get("quantity", 1)
-                total += menu_item["price"] * quantity
-                order_items.append({
-                    "name": menu_item["name"],
-                    "quantity": quantity,
-                    "price": menu_item["price"]
-                })
-        
-        # Create order with thread-safety
-        with orders_lock:
-            order_id = f"ORD{len(orders) + 1001}"
-            order = {
-                "order_id": order_id,
-                "restaurant": restaurant["name"],
-                "items": order_items,
-                "total": total,
-                "delivery_address": delivery_address,
-                "payment_method": "Cash on Delivery",
-                "status": "Order Placed",
-                "estimated_delivery": restaurant["delivery_time"]
-            }
-            orders.append(order)
-        
-        return [TextContent(
-            type="text",
-            text=json.dumps(order, indent=2)
-        )]
-    
+        text = _place_order(arguments)
     elif name == "get_order_status":
-        order_id = arguments.get("order_id")
-        with orders_lock:
-            order = next((o for o in orders if o["order_id"] == order_id), None)
-        if order:
-            return [TextContent(
-                type="text",
-                text=json.dumps(order, indent=2)
-            )]
-        else:
-            return [TextContent(
-                type="text",
-                text=json.dumps({"error": "Order not found"})
-            )]
+        text = _get_order_status(arguments)
+    else:
+        text = json.dumps({"error": f"Unknown tool: {name}"})
     
-    return [TextContent(
-        type="text",
-        text=json.dumps({"error": f"Unknown tool: {name}"})
-    )]
+    return [TextContent(type="text", text=text)]
 
 
 async def main():
     """Run the Zomato MCP server."""
-    async with stdio_server() as (read_stream, write_stream):
-        await app.run(read_stream, write_stream, app.create_initialization_options())
+    catalog.install_signal_handler()
+    install_profile_signal("mcp-server")
+    watcher = asyncio.create_task(
+        catalog.watch(float(os.getenv("ZOMATO_CATALOG_POLL_INTERVAL", "2")))
+    )
+    ticker = asyncio.create_task(lifecycle.run())
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await app.run(read_stream, write_stream, app.create_initialization_options())
+    finally:
+        watcher.cancel()
+        ticker.cancel()
+        executor.shutdown()
 
 
 if __name__ == "__main__":